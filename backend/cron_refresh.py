@@ -6,9 +6,9 @@ This script is designed to be run by Railway's cron service.
 It refreshes only the current season's standings and exits cleanly.
 """
 import sys
-from database import init_db, get_db_session
-from models import TeamRealignment
+from database import init_db, get_db_session, dispose_engine
 from services.scraper_service import (
+    realignment_empty,
     initialize_realignment,
     scrape_current_season,
     REALIGNMENT_DATA
@@ -30,8 +30,7 @@ def main():
     
     try:
         # Initialize realignment data if needed
-        realignment_count = db.query(TeamRealignment).count()
-        if realignment_count == 0:
+        if realignment_empty(db):
             print("Initializing team realignment data...")
             initialize_realignment(db)
             print(f"✓ Initialized {len(REALIGNMENT_DATA)} teams")
@@ -58,6 +57,7 @@ def main():
     finally:
         # Ensure database connection is closed
         db.close()
+        dispose_engine()
         print("Database connection closed.")
 
 
@@ -1,32 +1,146 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+from typing import Optional
 import os
+from urllib.parse import urlsplit
 from models import Base
 
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./nfl_standings.db')
 
-# Fix Railway's postgres:// to postgresql://
-if DATABASE_URL.startswith('postgres://'):
-    DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
-
-# IMPORTANT: Use psycopg (version 3) driver explicitly
-if DATABASE_URL.startswith('postgresql://'):
-    DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+psycopg://', 1)
+# Railway provides postgres:// (or postgresql://) URLs; IMPORTANT: use the
+# psycopg (version 3) driver explicitly
+_url = urlsplit(DATABASE_URL)
+if _url.scheme in ('postgres', 'postgresql'):
+    # Swap only the scheme so host-less URLs (postgres:///db?host=...) survive
+    DATABASE_URL = 'postgresql+psycopg' + DATABASE_URL[len(_url.scheme):]
 
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if 'sqlite' in DATABASE_URL else {}
-)
+if DATABASE_URL.startswith('postgresql+psycopg://'):
+    # Size the pool for concurrent API requests plus scheduler runs, and
+    # recycle/ping connections so Railway's idle drops don't surface as errors
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True
+    )
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False} if 'sqlite' in DATABASE_URL else {}
+    )
+
+if 'sqlite' in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so scheduled refreshes don't block API readers."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-16000")  # ~16 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
 
 # Rest stays the same...
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _migrate_columns():
+    """Add columns introduced after the initial schema to existing tables."""
+    try:
+        with engine.connect() as conn:
+            columns_to_add = {
+                'team_standings': [
+                    ('in_division_wins', 'INTEGER DEFAULT 0'),
+                    ('in_division_losses', 'INTEGER DEFAULT 0'),
+                    ('in_division_ties', 'INTEGER DEFAULT 0'),
+                    ('in_division_win_pct', 'REAL DEFAULT 0.0')
+                ],
+                'team_game_scores': [
+                    ('is_division_game', 'BOOLEAN DEFAULT FALSE')
+                ]
+            }
+            
+            added_count = 0
+            added_columns = []
+            for table_name, table_columns in columns_to_add.items():
+                # Check if columns already exist
+                if 'sqlite' in DATABASE_URL.lower():
+                    # SQLite
+                    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                    existing_columns = [row[1] for row in result]
+                else:
+                    # PostgreSQL
+                    result = conn.execute(text("""
+                        SELECT column_name 
+                        FROM information_schema.columns 
+                        WHERE table_name = :table_name
+                    """), {'table_name': table_name})
+                    existing_columns = [row[0] for row in result]
+                
+                for col_name, col_def in table_columns:
+                    if col_name not in existing_columns:
+                        try:
+                            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def}"))
+                            conn.commit()
+                            print(f"✓ Migration: Added column {table_name}.{col_name}")
+                            added_count += 1
+                            added_columns.append(col_name)
+                        except Exception as e:
+                            print(f"⚠ Migration warning for {col_name}: {e}")
+            
+            if 'is_division_game' in added_columns:
+                # Backfill the new flag from the realignment table in one UPDATE
+                from services.scraper_service import update_division_game_flags
+                update_division_game_flags(conn)
+                conn.commit()
+                print("✓ Migration: Backfilled team_game_scores.is_division_game")
+            
+            if added_count > 0:
+                print(f"✓ Database migration complete: Added {added_count} column(s)")
+            else:
+                print("✓ Database migration: All columns already exist")
+    except Exception as e:
+        # Don't fail startup if migration has issues - log it instead
+        print(f"⚠ Database migration check failed (non-critical): {e}")
+        print("  You can run migrate_add_in_division_standings.py manually if needed")
+
+def _dedupe_team_standings(conn):
+    """Keep only the newest (MAX(id)) team_standings row per season/team."""
+    # Older databases had no unique constraint on team_standings, and duplicate
+    # rows would make creating uq_team_standing fail
+    result = conn.execute(text("""
+        DELETE FROM team_standings
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM team_standings GROUP BY season, team
+        )
+    """))
+    if result.rowcount:
+        print(f"✓ Migration: Removed {result.rowcount} duplicate team_standings row(s)")
+
 def init_db():
-    """Initialize the database by creating all tables."""
+    """Initialize the database by creating all tables and adding missing columns/indexes."""
     Base.metadata.create_all(bind=engine)
+    
+    # Existing tables may predate newer columns; add them before creating
+    # indexes that reference them (e.g. ix_ts_season_winpct)
+    _migrate_columns()
+    
+    # create_all() doesn't add indexes to tables that already exist, so create
+    # any missing ones (e.g. uq_team_standing, needed by the scraper's upserts)
+    with engine.begin() as conn:
+        existing = {index['name'] for index in inspect(conn).get_indexes('team_standings')}
+        if 'uq_team_standing' not in existing:
+            _dedupe_team_standings(conn)
+        
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
 
 @contextmanager
 def get_db():
@@ -43,4 +157,25 @@ def get_db():
 
 def get_db_session() -> Session:
     """Get a database session (for use without context manager)."""
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal()
+
+@contextmanager
+def session_scope(db: Optional[Session] = None):
+    """
+    Context manager that reuses a caller's session, or opens (and closes) a new one.
+    
+    Args:
+        db: Optional existing session. If given, it is yielded as-is and left open.
+    """
+    if db is not None:
+        yield db
+        return
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+def dispose_engine():
+    """Close all pooled connections (call before a short-lived process exits)."""
+    engine.dispose()
@@ -1,12 +1,25 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 import traceback
 import os
-from apscheduler.schedulers.background import BackgroundScheduler
+import hashlib
+import json
+import asyncio
+import threading
+from cachetools import TTLCache
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from database import init_db, get_db_session
-from services.standings_service import get_standings, get_available_seasons
+from services.standings_service import (
+    get_standings,
+    get_available_seasons,
+    load_realignment_map,
+    get_realignment_map,
+    invalidate_standings_cache,
+    STANDINGS_CACHE_TTL
+)
 from services.game_scores_service import get_game_scores
 
 app = FastAPI(title="NFL Standings API")
@@ -47,18 +60,111 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize scheduler
-scheduler = BackgroundScheduler()
+# Initialize scheduler (runs on FastAPI's event loop; the blocking scrape goes to a thread)
+# coalesce/max_instances/misfire_grace_time: after downtime, run a missed refresh
+# once instead of stacking several concurrent ones
+scheduler = AsyncIOScheduler(job_defaults={
+    'coalesce': True,
+    'max_instances': 1,
+    'misfire_grace_time': 1800
+})
+
+# Held by scheduled scrapes and the manual refresh endpoints (/api/refresh,
+# /api/refresh-all, /api/refresh-realignment) so two writers never overlap
+_refresh_lock = threading.Lock()
+
+# NFL-optimized refresh schedule (used when REFRESH_SCHEDULE=nfl_schedule, the default):
+# multiple runs on game days, all times UTC
+NFL_SCHEDULES = [
+    ("0 3 * * 0,1,2,5,6", "Daily maintenance"),  # Every day except Thursday (Thu has TNF update)
+    ("30 4 * * 4", "After Thursday Night Football"),  # Thursday 4:30 AM UTC
+    ("0 21 * * 0", "After Sunday early games"),  # Sunday 9:00 PM UTC (after 1 PM ET games)
+    ("30 0 * * 1", "After Sunday late games"),  # Monday 12:30 AM UTC (after 4:25 PM ET games)
+    ("30 4 * * 1", "After Sunday Night Football"),  # Monday 4:30 AM UTC (after 8:20 PM ET SNF)
+    ("15 4 * * 2", "After Monday Night Football"),  # Tuesday 4:15 AM UTC (after 8:15 PM ET MNF)
+]
+
+# In-process cache for read endpoints. Data only changes when a refresh runs,
+# which clears it; the TTL covers refreshes done by the separate cron process.
+# It sits in front of get_standings' own cache and shares STANDINGS_CACHE_TTL,
+# so cron writes reach /api/standings within at most two TTLs (a response can
+# be built from a service entry that is already up to one TTL old).
+# Entries are (serialized JSON body, ETag), so hits skip re-encoding entirely.
+_response_cache = TTLCache(maxsize=64, ttl=STANDINGS_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+# Bumped on every clear, so a load that raced a refresh doesn't re-cache stale data
+_response_cache_generation = 0
+
+
+# Let browsers/CDNs reuse a response briefly, then revalidate with If-None-Match
+CACHE_CONTROL = "public, max-age=60"
+
+
+def clear_response_cache():
+    """Drop cached /api/standings and /api/seasons responses."""
+    global _response_cache_generation
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_generation += 1
+    invalidate_standings_cache()
+
+
+def _make_etag(body: bytes) -> str:
+    """Build a strong ETag from the serialized response body."""
+    return '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
 
-def refresh_standings_job():
+
+def _json_bytes(data) -> bytes:
+    """Serialize a response body once, the same way FastAPI's JSONResponse does."""
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_standings(season: Optional[int]):
+    """Load standings as JSON bytes plus their ETag (blocking; run in the threadpool)."""
+    body = _json_bytes(get_standings(season))
+    return body, _make_etag(body)
+
+
+def _load_seasons():
+    """Load available seasons as JSON bytes plus their ETag (blocking; run in the threadpool)."""
+    body = _json_bytes({"seasons": get_available_seasons()})
+    return body, _make_etag(body)
+
+
+async def refresh_standings_job():
     """Scheduled job to refresh current season standings."""
+    await asyncio.to_thread(_refresh_standings)
+
+
+def _refresh_standings():
+    """Refresh current season standings (blocking; run via refresh_standings_job)."""
+    if not _refresh_lock.acquire(blocking=False):
+        print("Standings refresh already running - skipping this run")
+        return
+    try:
+        _run_standings_refresh()
+    finally:
+        _refresh_lock.release()
+
+
+def _run_standings_refresh():
+    """Scrape and store current season standings (caller holds _refresh_lock)."""
     print("=" * 60)
     print("Starting scheduled standings refresh...")
     print("=" * 60)
     
     try:
-        from models import TeamRealignment
         from services.scraper_service import (
+            realignment_empty,
             initialize_realignment,
             scrape_current_season,
             REALIGNMENT_DATA
@@ -67,8 +173,7 @@ def refresh_standings_job():
         db = get_db_session()
         try:
             # Initialize realignment data if needed
-            realignment_count = db.query(TeamRealignment).count()
-            if realignment_count == 0:
+            if realignment_empty(db):
                 print("Initializing team realignment data...")
                 initialize_realignment(db)
                 print(f"✓ Initialized {len(REALIGNMENT_DATA)} teams")
@@ -78,6 +183,7 @@ def refresh_standings_job():
             result = scrape_current_season(db)
             
             if result['success']:
+                clear_response_cache()
                 print(f"✓ Successfully refreshed {result['records_updated']} records")
                 print(f"  Season: {result['season_scraped']}")
                 print("=" * 60)
@@ -96,133 +202,47 @@ def refresh_standings_job():
 async def startup_event():
     init_db()
     
-    # Run database migration for in-division standings columns
+    # Load the (essentially static) realignment map once instead of per request
+    db = get_db_session()
     try:
-        from sqlalchemy import create_engine, text, inspect
-        import os
-        
-        DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./nfl_standings.db')
-        
-        # Fix postgres:// to postgresql:// if needed
-        if DATABASE_URL.startswith('postgres://'):
-            DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
-        
-        # Use psycopg driver for PostgreSQL
-        if DATABASE_URL.startswith('postgresql://'):
-            DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+psycopg://', 1)
-        
-        engine = create_engine(DATABASE_URL)
-        
-        with engine.connect() as conn:
-            # Check if columns already exist
-            if 'sqlite' in DATABASE_URL.lower():
-                # SQLite
-                result = conn.execute(text("PRAGMA table_info(team_standings)"))
-                existing_columns = [row[1] for row in result]
-            else:
-                # PostgreSQL
-                result = conn.execute(text("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'team_standings'
-                """))
-                existing_columns = [row[0] for row in result]
-            
-            columns_to_add = [
-                ('in_division_wins', 'INTEGER DEFAULT 0'),
-                ('in_division_losses', 'INTEGER DEFAULT 0'),
-                ('in_division_ties', 'INTEGER DEFAULT 0'),
-                ('in_division_win_pct', 'REAL DEFAULT 0.0')
-            ]
-            
-            added_count = 0
-            for col_name, col_def in columns_to_add:
-                if col_name not in existing_columns:
-                    try:
-                        conn.execute(text(f"ALTER TABLE team_standings ADD COLUMN {col_name} {col_def}"))
-                        conn.commit()
-                        print(f"✓ Migration: Added column {col_name}")
-                        added_count += 1
-                    except Exception as e:
-                        print(f"⚠ Migration warning for {col_name}: {e}")
-            
-            if added_count > 0:
-                print(f"✓ Database migration complete: Added {added_count} column(s)")
-            else:
-                print("✓ Database migration: All columns already exist")
-    except Exception as e:
-        # Don't fail startup if migration has issues - log it instead
-        print(f"⚠ Database migration check failed (non-critical): {e}")
-        print("  You can run migrate_add_in_division_standings.py manually if needed")
+        load_realignment_map(db)
+    finally:
+        db.close()
     
     # Configure scheduler based on environment variable
     # Default: NFL game schedule - multiple runs on game days
     # Format: "hour minute" (e.g., "3 0" for 3:00 AM) or cron expression
-    # For multiple schedules, use comma-separated cron expressions
     refresh_schedule = os.getenv('REFRESH_SCHEDULE', 'nfl_schedule')
     
     if refresh_schedule == 'nfl_schedule':
-        # NFL-optimized schedule: Run multiple times on game days
-        # Thursday: 4:30 AM UTC (after Thursday Night Football ~11:30 PM ET)
-        # Sunday: 9:00 PM, 12:30 AM, 4:30 AM UTC (after early, late, and SNF games)
-        # Monday: 4:15 AM UTC (after Monday Night Football ~11:15 PM ET)
-        # Other days: 3:00 AM UTC (daily maintenance)
-        schedules = [
-            ("0 3 * * 0,1,2,5,6", "Daily maintenance"),  # Every day except Thursday (Thu has TNF update)
-            ("30 4 * * 4", "After Thursday Night Football"),  # Thursday 4:30 AM UTC
-            ("0 21 * * 0", "After Sunday early games"),  # Sunday 9:00 PM UTC (after 1 PM ET games)
-            ("30 0 * * 1", "After Sunday late games"),  # Monday 12:30 AM UTC (after 4:25 PM ET games)
-            ("30 4 * * 1", "After Sunday Night Football"),  # Monday 4:30 AM UTC (after 8:20 PM ET SNF)
-            ("15 4 * * 2", "After Monday Night Football"),  # Tuesday 4:15 AM UTC (after 8:15 PM ET MNF)
+        jobs = [
+            (cron_expr, f'refresh_standings_{i}', f'Refresh NFL Standings - {description}')
+            for i, (cron_expr, description) in enumerate(NFL_SCHEDULES)
         ]
-        
-        for i, (cron_expr, description) in enumerate(schedules):
-            scheduler.add_job(
-                refresh_standings_job,
-                trigger=CronTrigger.from_crontab(cron_expr),
-                id=f'refresh_standings_{i}',
-                name=f'Refresh NFL Standings - {description}',
-                replace_existing=True
-            )
-            print(f"Scheduled: {description} - cron: {cron_expr}")
     else:
-        # Check if it's a simple "hour minute" format or full cron expression
-        if ' ' in refresh_schedule and len(refresh_schedule.split()) == 2:
+        cron_parts = refresh_schedule.split()
+        if len(cron_parts) == 2:
             # Simple format: "hour minute" -> convert to cron
-            hour, minute = refresh_schedule.split()
+            hour, minute = cron_parts
             cron_expr = f"{minute} {hour} * * *"
-            print(f"Scheduling standings refresh with cron: {cron_expr}")
-            scheduler.add_job(
-                refresh_standings_job,
-                trigger=CronTrigger.from_crontab(cron_expr),
-                id='refresh_standings',
-                name='Refresh NFL Standings',
-                replace_existing=True
-            )
+        elif len(cron_parts) == 5:
+            # Already a cron expression (minute hour day month day_of_week)
+            cron_expr = refresh_schedule
         else:
-            # Assume it's already a cron expression (minute hour day month day_of_week)
-            cron_parts = refresh_schedule.split()
-            if len(cron_parts) == 5:
-                cron_expr = refresh_schedule
-                print(f"Scheduling standings refresh with cron: {cron_expr}")
-                scheduler.add_job(
-                    refresh_standings_job,
-                    trigger=CronTrigger.from_crontab(cron_expr),
-                    id='refresh_standings',
-                    name='Refresh NFL Standings',
-                    replace_existing=True
-                )
-            else:
-                # Default fallback
-                cron_expr = "0 3 * * *"
-                print(f"Invalid schedule format, using default: {cron_expr}")
-                scheduler.add_job(
-                    refresh_standings_job,
-                    trigger=CronTrigger.from_crontab(cron_expr),
-                    id='refresh_standings',
-                    name='Refresh NFL Standings',
-                    replace_existing=True
-                )
+            # Default fallback
+            cron_expr = "0 3 * * *"
+            print(f"Invalid schedule format, using default: {cron_expr}")
+        jobs = [(cron_expr, 'refresh_standings', 'Refresh NFL Standings')]
+    
+    for cron_expr, job_id, name in jobs:
+        scheduler.add_job(
+            refresh_standings_job,
+            trigger=CronTrigger.from_crontab(cron_expr),
+            id=job_id,
+            name=name,
+            replace_existing=True
+        )
+        print(f"Scheduled: {name} - cron: {cron_expr}")
     
     scheduler.start()
     print("✓ Scheduler started")
@@ -239,13 +259,29 @@ async def root():
     return {"message": "NFL Standings API"}
 
 @app.get("/api/standings")
-async def standings(season: Optional[int] = None):
+async def standings(request: Request, season: Optional[int] = None):
     """
     Get NFL standings organized by custom conferences and divisions.
     If season is not provided, uses current season data.
+    Supports conditional requests via ETag / If-None-Match.
     """
     try:
-        return get_standings(season)
+        key = ('standings', season if season is not None else 'current')
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+            generation = _response_cache_generation
+        if cached is None:
+            cached = await run_in_threadpool(_load_standings, season)
+            with _response_cache_lock:
+                if generation == _response_cache_generation:
+                    _response_cache[key] = cached
+        body, etag = cached
+        
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        # Serve the cached, already-serialized body as-is
+        return Response(content=body, media_type="application/json", headers=headers)
     except Exception as e:
         # Log the full error for debugging
         print(f"Error in standings endpoint: {str(e)}")
@@ -256,13 +292,26 @@ async def standings(season: Optional[int] = None):
         )
 
 @app.get("/api/seasons")
-async def seasons():
+async def seasons(request: Request):
     """
     Get list of available seasons in the database.
+    Supports conditional requests via ETag / If-None-Match.
     """
     try:
-        seasons_list = get_available_seasons()
-        return {"seasons": seasons_list}
+        with _response_cache_lock:
+            cached = _response_cache.get('seasons')
+            generation = _response_cache_generation
+        if cached is None:
+            cached = await run_in_threadpool(_load_seasons)
+            with _response_cache_lock:
+                if generation == _response_cache_generation:
+                    _response_cache['seasons'] = cached
+        body, etag = cached
+        
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except Exception as e:
         print(f"Error in seasons endpoint: {str(e)}")
         print(traceback.format_exc())
@@ -294,7 +343,7 @@ async def game_scores(team: str, season: int):
                 detail="Team must be a 2-3 letter abbreviation (e.g., 'DAL', 'KC', 'SF')"
             )
         
-        scores = get_game_scores(team, season)
+        scores = await run_in_threadpool(get_game_scores, team, season)
         
         if not scores:
             return {
@@ -321,15 +370,18 @@ async def game_scores(team: str, season: int):
         )
 
 @app.post("/api/refresh")
-async def refresh_standings():
+def refresh_standings():
     """
     Manually trigger a standings refresh for the current season.
     Useful for testing or triggering refreshes outside of the cron schedule.
     """
+    if not _refresh_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A refresh is already running")
+    
     try:
         from database import get_db_session
-        from models import TeamRealignment
         from services.scraper_service import (
+            realignment_empty,
             initialize_realignment,
             scrape_current_season,
             REALIGNMENT_DATA
@@ -338,14 +390,14 @@ async def refresh_standings():
         db = get_db_session()
         try:
             # Initialize realignment data if needed
-            realignment_count = db.query(TeamRealignment).count()
-            if realignment_count == 0:
+            if realignment_empty(db):
                 initialize_realignment(db)
             
             # Scrape current season
             result = scrape_current_season(db)
             
             if result['success']:
+                clear_response_cache()
                 return {
                     "success": True,
                     "message": "Standings refreshed successfully",
@@ -366,18 +418,23 @@ async def refresh_standings():
             status_code=500,
             detail=f"Error refreshing standings: {str(e)}"
         )
+    finally:
+        _refresh_lock.release()
 
 @app.post("/api/refresh-all")
-async def refresh_all_seasons():
+def refresh_all_seasons():
     """
     Manually trigger a full historical scrape of all seasons.
     This will populate game scores and standings for all available seasons.
     WARNING: This may take several minutes to complete.
     """
+    if not _refresh_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A refresh is already running")
+    
     try:
         from database import get_db_session
-        from models import TeamRealignment
         from services.scraper_service import (
+            realignment_empty,
             initialize_realignment,
             scrape_all_seasons,
             REALIGNMENT_DATA
@@ -386,8 +443,7 @@ async def refresh_all_seasons():
         db = get_db_session()
         try:
             # Initialize realignment data if needed
-            realignment_count = db.query(TeamRealignment).count()
-            if realignment_count == 0:
+            if realignment_empty(db):
                 initialize_realignment(db)
             
             # Scrape all seasons
@@ -395,6 +451,7 @@ async def refresh_all_seasons():
             result = scrape_all_seasons(db)
             
             if result['success']:
+                clear_response_cache()
                 return {
                     "success": True,
                     "message": "All seasons scraped successfully",
@@ -415,17 +472,21 @@ async def refresh_all_seasons():
             status_code=500,
             detail=f"Error refreshing all seasons: {str(e)}"
         )
+    finally:
+        _refresh_lock.release()
 
 @app.post("/api/refresh-realignment")
-async def refresh_realignment():
+def refresh_realignment():
     """
     Update team realignment data in the database with the latest REALIGNMENT_DATA.
     This will update existing records with new conference/division assignments.
     Use this after updating REALIGNMENT_DATA in the code.
     """
+    if not _refresh_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A refresh is already running")
+    
     try:
         from database import get_db_session
-        from models import TeamRealignment
         from services.scraper_service import (
             initialize_realignment,
             REALIGNMENT_DATA
@@ -436,9 +497,10 @@ async def refresh_realignment():
             # Update realignment data (including existing records)
             print("Updating team realignment data...")
             initialize_realignment(db, update_existing=True)
+            clear_response_cache()
             
             # Count updated records
-            realignment_count = db.query(TeamRealignment).count()
+            realignment_count = len(get_realignment_map(db))
             
             return {
                 "success": True,
@@ -455,4 +517,6 @@ async def refresh_realignment():
             status_code=500,
             detail=f"Error updating realignment data: {str(e)}"
         )
+    finally:
+        _refresh_lock.release()
 
@@ -1,7 +1,5 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, UniqueConstraint
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, UniqueConstraint, Index, func
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
@@ -10,8 +8,8 @@ class TeamStanding(Base):
     __tablename__ = 'team_standings'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    season = Column(Integer, nullable=False, index=True)
-    team = Column(String(3), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    team = Column(String(3), nullable=False)
     wins = Column(Integer, default=0)
     losses = Column(Integer, default=0)
     ties = Column(Integer, default=0)
@@ -20,10 +18,14 @@ class TeamStanding(Base):
     in_division_losses = Column(Integer, default=0)
     in_division_ties = Column(Integer, default=0)
     in_division_win_pct = Column(Float, default=0.0)
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps come from the database clock (rendered inline as now()/CURRENT_TIMESTAMP)
+    last_updated = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), onupdate=func.now())
     
-    # Ensure unique season/team combination
+    # Ensure unique season/team combination (also serves season lookups);
+    # ix_ts_season_winpct returns a season's teams already in standings order
     __table_args__ = (
+        Index('uq_team_standing', 'season', 'team', unique=True),
+        Index('ix_ts_season_winpct', 'season', 'win_pct', 'in_division_win_pct'),
         {'sqlite_autoincrement': True}
     )
 
@@ -42,7 +44,7 @@ class ScrapeLog(Base):
     __tablename__ = 'scrape_logs'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    scrape_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    scrape_date = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), nullable=False)
     seasons_scraped = Column(String(255), nullable=False)  # Comma-separated list of seasons
     success = Column(Boolean, default=True)
     error_message = Column(String(1000), nullable=True)
@@ -53,20 +55,23 @@ class TeamGameScore(Base):
     __tablename__ = 'team_game_scores'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    season = Column(Integer, nullable=False, index=True)
+    season = Column(Integer, nullable=False)
     gameday = Column(DateTime, nullable=False, index=True)
     gametime = Column(String(20), nullable=True)  # Game time (e.g., "1:00 PM")
     score = Column(Integer, nullable=False)  # Team's score in this game
-    team = Column(String(3), nullable=False, index=True)
+    team = Column(String(3), nullable=False)
     opponent = Column(String(3), nullable=False)  # Opposing team abbreviation
     opponent_score = Column(Integer, nullable=False)  # Opponent's score in this game
     is_win = Column(Integer, default=0)
     is_loss = Column(Integer, default=0)
     is_tie = Column(Integer, default=0)
+    is_division_game = Column(Boolean, default=False)  # Opponent is in the same (realigned) division
     
     # Ensure unique season/gameday/team combination
     __table_args__ = (
         UniqueConstraint('season', 'gameday', 'team', name='uq_team_game_score'),
+        # Matches get_game_scores: filter on team + season, ordered by gameday
+        Index('ix_tgs_team_season_gameday', 'team', 'season', 'gameday'),
         {'sqlite_autoincrement': True}
     )
 
@@ -15,8 +15,8 @@ Usage:
 import argparse
 import sys
 from database import init_db, get_db_session
-from models import TeamRealignment
 from services.scraper_service import (
+    realignment_empty,
     initialize_realignment,
     scrape_all_seasons,
     scrape_current_season,
@@ -40,8 +40,7 @@ def main():
     
     try:
         # Initialize realignment data if needed
-        realignment_count = db.query(TeamRealignment).count()
-        if realignment_count == 0:
+        if realignment_empty(db):
             print("Initializing team realignment data...")
             initialize_realignment(db)
             print(f"✓ Initialized {len(REALIGNMENT_DATA)} teams")
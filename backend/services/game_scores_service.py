@@ -1,7 +1,31 @@
 from typing import Optional, List, Dict
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
-from database import get_db_session
-from models import TeamGameScore, TeamRealignment
+from database import session_scope
+from models import TeamGameScore
+
+# Columns returned by get_game_scores, selected directly (no ORM instances)
+GAME_SCORE_COLUMNS = (
+    TeamGameScore.id,
+    TeamGameScore.season,
+    TeamGameScore.gameday,
+    TeamGameScore.gametime,
+    TeamGameScore.score,
+    TeamGameScore.team,
+    TeamGameScore.opponent,
+    TeamGameScore.opponent_score,
+    TeamGameScore.is_win,
+    TeamGameScore.is_loss,
+    TeamGameScore.is_tie,
+    TeamGameScore.is_division_game
+)
+GAME_SCORE_KEYS = tuple(column.key for column in GAME_SCORE_COLUMNS)
+
+# Built once at import; per call only the bound team/season values change
+_GAME_SCORES_STMT = select(*GAME_SCORE_COLUMNS).where(
+    TeamGameScore.team == bindparam('team'),
+    TeamGameScore.season == bindparam('season')
+).order_by(TeamGameScore.gameday.desc())
 
 
 def get_game_scores(team: str, season: int, db: Optional[Session] = None) -> List[Dict]:
@@ -15,63 +39,19 @@ def get_game_scores(team: str, season: int, db: Optional[Session] = None) -> Lis
     
     Returns:
         List of game score dictionaries, ordered by gameday (most recent first).
-        Each dictionary includes an 'is_division_game' flag indicating if the opponent
-        is in the same division.
+        Each dictionary includes an 'is_division_game' flag (stored at scrape time)
+        indicating if the opponent is in the same division.
     """
-    if db is None:
-        db = get_db_session()
-        close_db = True
-    else:
-        close_db = False
-    
-    try:
-        # Get the team's division from realignment data
-        team_realignment = db.query(TeamRealignment).filter(
-            TeamRealignment.team == team.upper()
-        ).first()
-        
-        team_division = team_realignment.division if team_realignment else None
-        
-        # Create a map of opponent teams to their divisions
-        realignments = db.query(TeamRealignment).all()
-        opponent_division_map = {
-            r.team: r.division
-            for r in realignments
-        }
-        
+    with session_scope(db) as db:
         # Query game scores for the team and season (most recent first)
-        game_scores = db.query(TeamGameScore).filter(
-            TeamGameScore.team == team.upper(),
-            TeamGameScore.season == season
-        ).order_by(TeamGameScore.gameday.desc()).all()
+        rows = db.execute(_GAME_SCORES_STMT, {'team': team.upper(), 'season': season}).all()
         
         result = []
-        for gs in game_scores:
-            # Check if opponent is in the same division
-            opponent_division = opponent_division_map.get(gs.opponent)
-            is_division_game = (
-                team_division is not None and
-                opponent_division is not None and
-                team_division == opponent_division
-            )
-            
-            result.append({
-                'id': gs.id,
-                'season': gs.season,
-                'gameday': gs.gameday.isoformat() if gs.gameday else None,
-                'gametime': gs.gametime,
-                'score': gs.score,
-                'team': gs.team,
-                'opponent': gs.opponent,
-                'opponent_score': gs.opponent_score,
-                'is_win': gs.is_win,
-                'is_loss': gs.is_loss,
-                'is_tie': gs.is_tie,
-                'is_division_game': is_division_game
-            })
+        for row in rows:
+            game_score = dict(zip(GAME_SCORE_KEYS, row))
+            game_score['gameday'] = game_score['gameday'].isoformat() if game_score['gameday'] else None
+            game_score['is_division_game'] = bool(game_score['is_division_game'])
+            result.append(game_score)
         
         return result
-    finally:
-        if close_db:
-            db.close()
 
@@ -1,11 +1,17 @@
 import pandas as pd
 import numpy as np
 import nflreadpy as nfl
+import os
+import tempfile
+import threading
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
+from cachetools import TTLCache
+from sqlalchemy import exists, update
 from sqlalchemy.orm import Session
 from models import TeamStanding, TeamRealignment, ScrapeLog, TeamGameScore
 from database import get_db_session
+from services.standings_service import get_realignment_map, load_realignment_map, invalidate_standings_cache
 
 # Realignment data - teams organized into custom conferences and divisions
 REALIGNMENT_DATA = [
@@ -44,6 +50,113 @@ REALIGNMENT_DATA = [
 ]
 
 
+# REALIGNMENT_DATA as column dictionaries, ready for a single multi-row INSERT
+REALIGNMENT_RECORDS = [
+    {'team': team, 'conference': conference, 'division': division, 'name': name}
+    for team, conference, division, name in REALIGNMENT_DATA
+]
+
+
+# Schedule downloads for the live season(s), reused briefly so back-to-back
+# refreshes don't re-fetch the same file
+SCHEDULE_CACHE_TTL = 600
+_schedule_cache = TTLCache(maxsize=4, ttl=SCHEDULE_CACHE_TTL)
+_schedule_cache_lock = threading.Lock()
+
+# Completed seasons never change, so their schedules are kept on disk
+SCHEDULE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'nfl_schedules')
+
+# Schedule columns used by create_game_scores_dataframe; the rest (weather,
+# betting lines, officials, ...) are dropped right after download
+SCHEDULE_COLUMNS = [
+    'season', 'game_type', 'gameday', 'gametime',
+    'home_team', 'away_team', 'home_score', 'away_score'
+]
+
+
+def _is_completed_season(season) -> bool:
+    """
+    Check whether a season is over (its Super Bowl was played by February of the next year).
+    """
+    now = datetime.now()
+    current_season = now.year if now.month >= 3 else now.year - 1
+    return isinstance(season, int) and not isinstance(season, bool) and season < current_season
+
+
+def _fetch_schedules(seasons: Union[int, bool, None]) -> pd.DataFrame:
+    """
+    Download schedules and convert only the completed regular season games to pandas.
+    
+    nflreadpy returns Polars; filtering rows and columns there first means unplayed
+    and postseason games, and unused columns, are never materialized as pandas objects.
+    """
+    schedules = nfl.load_schedules(seasons=seasons)
+    return schedules.filter(
+        schedules['home_score'].is_not_null()
+        & schedules['away_score'].is_not_null()
+        & (schedules['game_type'] == 'REG')
+    ).select(SCHEDULE_COLUMNS).to_pandas()
+
+
+def load_schedules(seasons: Union[int, bool, None] = None) -> pd.DataFrame:
+    """
+    Load completed regular season games from nflreadpy, caching downloads.
+    
+    Completed seasons are cached on disk indefinitely; the current season and
+    the all-seasons file are cached in memory for SCHEDULE_CACHE_TTL seconds.
+    
+    Args:
+        seasons: Passed to nfl.load_schedules (None = most recent season,
+                 True = all seasons, int = a specific season)
+    
+    Returns:
+        Schedule DataFrame of completed regular season games (a copy, safe for the caller to modify)
+    """
+    if _is_completed_season(seasons):
+        path = os.path.join(SCHEDULE_CACHE_DIR, f'schedule_{seasons}.parquet')
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        scores = _fetch_schedules(seasons)
+        try:
+            # Write then rename so a concurrent reader never sees a partial file
+            os.makedirs(SCHEDULE_CACHE_DIR, exist_ok=True)
+            scores.to_parquet(f'{path}.{os.getpid()}.tmp')
+            os.replace(f'{path}.{os.getpid()}.tmp', path)
+        except Exception as e:
+            print(f"⚠ Could not cache schedule for {seasons}: {e}")
+        return scores
+    
+    with _schedule_cache_lock:
+        scores = _schedule_cache.get(seasons)
+    if scores is None:
+        scores = _fetch_schedules(seasons)
+        with _schedule_cache_lock:
+            _schedule_cache[seasons] = scores
+    return scores.copy()
+
+
+def get_division_map(db: Session) -> dict:
+    """
+    Get a team -> division mapping from the cached realignment map.
+    
+    Args:
+        db: Database session (only used if the realignment cache is empty)
+    
+    Returns:
+        Dictionary mapping team abbreviation to division name.
+    """
+    return {team: division for team, (_, division, _) in get_realignment_map(db).items()}
+
+
+def realignment_empty(db: Session) -> bool:
+    """
+    Check whether the team realignment table has no rows.
+    
+    Uses EXISTS so the check stops at the first row instead of counting all of them.
+    """
+    return not db.query(db.query(TeamRealignment).exists()).scalar()
+
+
 def initialize_realignment(db: Session, update_existing: bool = False):
     """
     Initialize team realignment data in the database.
@@ -53,23 +166,44 @@ def initialize_realignment(db: Session, update_existing: bool = False):
         update_existing: If True, updates existing records with new data. 
                         If False (default), only adds new teams.
     """
-    for team_data in REALIGNMENT_DATA:
-        team, conference, division, name = team_data
-        existing = db.query(TeamRealignment).filter(TeamRealignment.team == team).first()
-        if not existing:
-            realignment = TeamRealignment(
-                team=team,
-                conference=conference,
-                division=division,
-                name=name
-            )
-            db.add(realignment)
-        elif update_existing:
-            # Update existing record with new data
-            existing.conference = conference
-            existing.division = division
-            existing.name = name
+    # Seed (and optionally overwrite) all teams with a single INSERT ... ON CONFLICT
+    stmt = _dialect_insert(db)(TeamRealignment).values(REALIGNMENT_RECORDS)
+    if update_existing:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['team'],
+            set_={
+                'conference': stmt.excluded.conference,
+                'division': stmt.excluded.division,
+                'name': stmt.excluded.name
+            }
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=['team'])
+    db.execute(stmt)
+    
+    # Division assignments may have changed, so re-derive the stored flags
+    update_division_game_flags(db)
     db.commit()
+    
+    # Reload the process-level map; bumping its version retires cached standings
+    load_realignment_map(db)
+
+
+def update_division_game_flags(db):
+    """
+    Recompute TeamGameScore.is_division_game from the team_realignment table.
+    
+    Args:
+        db: Database session or connection. The caller is responsible for committing.
+    """
+    team_realignment = TeamRealignment.__table__.alias('team_realignment_team')
+    opponent_realignment = TeamRealignment.__table__.alias('team_realignment_opponent')
+    is_division_game = exists().where(
+        team_realignment.c.team == TeamGameScore.team,
+        opponent_realignment.c.team == TeamGameScore.opponent,
+        team_realignment.c.division == opponent_realignment.c.division
+    )
+    db.execute(update(TeamGameScore).values(is_division_game=is_division_game))
 
 
 def create_game_scores_dataframe(scores: pd.DataFrame) -> pd.DataFrame:
@@ -82,48 +216,81 @@ def create_game_scores_dataframe(scores: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: season, gameday, gametime, team, opponent, score, opponent_score, is_win, is_loss, is_tie
     """
-    scores['gameday'] = pd.to_datetime(scores['gameday'])
-    
     # Filter to completed regular season games
     # A game is considered completed if both home_score and away_score are not null
     # This allows us to include games from today that have finished
-    scores = scores.loc[
-        (scores['home_score'].notna())
-        & (scores['away_score'].notna())
-        & (scores['game_type'] == 'REG')
-    ]
+    completed = ~(
+        np.isnan(scores['home_score'].to_numpy(dtype='float64', na_value=np.nan))
+        | np.isnan(scores['away_score'].to_numpy(dtype='float64', na_value=np.nan))
+    )
+    scores = scores.iloc[completed & (scores['game_type'].to_numpy() == 'REG')]
     
     if scores.empty:
         return pd.DataFrame(columns=['season', 'gameday', 'gametime', 'team', 'opponent', 'score', 'opponent_score', 'is_win', 'is_loss', 'is_tie'])
     
-    # Create one row per team per game using the new approach
-    sides = [('home', 'away'), ('away', 'home')]
-    long_scores = pd.DataFrame()
+    # Create one row per team per game, built directly from the underlying
+    # column arrays (no copy of the full schedule frame)
+    season = scores['season'].to_numpy(dtype=np.int16)
+    # Game days are ISO dates; an explicit format skips per-call inference
+    gameday = pd.to_datetime(scores['gameday'], format='%Y-%m-%d', cache=True).to_numpy()
+    gametime = scores['gametime'].to_numpy()
+    home_score = scores['home_score'].to_numpy(dtype=np.int16)
+    away_score = scores['away_score'].to_numpy(dtype=np.int16)
+    home_team = scores['home_team'].to_numpy()
+    away_team = scores['away_team'].to_numpy()
     
-    for side1, side2 in sides:
-        side_scores = scores.copy()
-        side_scores['team'] = side_scores[f'{side1}_team']
-        side_scores['opponent'] = side_scores[f'{side2}_team']
-        side_scores['score'] = side_scores[f'{side1}_score']
-        side_scores['opponent_score'] = side_scores[f'{side2}_score']
-        
-        # Determine wins, losses, and ties based on score comparison
-        side_scores['is_win'] = (side_scores['score'] > side_scores['opponent_score']).astype(int)
-        side_scores['is_loss'] = (side_scores['score'] < side_scores['opponent_score']).astype(int)
-        side_scores['is_tie'] = (side_scores['score'] == side_scores['opponent_score']).astype(int)
-        
-        keep_cols = ['season', 'gameday', 'gametime', 'team', 'opponent', 'score', 'opponent_score', 'is_win', 'is_loss', 'is_tie']
-        long_scores = pd.concat([long_scores, side_scores[keep_cols]], ignore_index=True)
+    # Determine wins, losses, and ties once per game from the sign of the home
+    # margin; a home win is an away loss and vice versa
+    home_sign = np.sign(home_score - away_score)
+    home_won = (home_sign > 0).view(np.int8)
+    away_won = (home_sign < 0).view(np.int8)
+    is_tie = (home_sign == 0).view(np.int8)
     
-    # Ensure proper data types
-    long_scores['season'] = long_scores['season'].astype(int)
-    long_scores['score'] = long_scores['score'].astype(int)
-    long_scores['opponent_score'] = long_scores['opponent_score'].astype(int)
-    long_scores['is_win'] = long_scores['is_win'].astype(int)
-    long_scores['is_loss'] = long_scores['is_loss'].astype(int)
-    long_scores['is_tie'] = long_scores['is_tie'].astype(int)
+    # Stack the home rows on top of the away rows column by column
+    return pd.DataFrame({
+        'season': np.concatenate([season, season]),
+        'gameday': np.concatenate([gameday, gameday]),
+        'gametime': np.concatenate([gametime, gametime]),
+        'team': np.concatenate([home_team, away_team]),
+        'opponent': np.concatenate([away_team, home_team]),
+        'score': np.concatenate([home_score, away_score]),
+        'opponent_score': np.concatenate([away_score, home_score]),
+        'is_win': np.concatenate([home_won, away_won]),
+        'is_loss': np.concatenate([away_won, home_won]),
+        'is_tie': np.concatenate([is_tie, is_tie])
+    }, copy=False)
+
+
+def _sum_results_by_season_team(game_scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Total is_win, is_loss, and is_tie per (season, team).
+    
+    Equivalent to groupby(['season', 'team']).sum(), done as np.bincount over
+    factorized integer keys instead of hashing the team strings per group.
+    
+    Args:
+        game_scores: DataFrame with one row per team per game
     
-    return long_scores
+    Returns:
+        DataFrame with columns: season, team, is_win, is_loss, is_tie
+    """
+    season_codes, season_labels = pd.factorize(game_scores['season'])
+    team_codes, team_labels = pd.factorize(game_scores['team'])
+    n_teams = len(team_labels)
+    n_keys = len(season_labels) * n_teams
+    keys = season_codes * n_teams + team_codes
+    
+    # Only keep (season, team) pairs that actually played
+    played = np.flatnonzero(np.bincount(keys, minlength=n_keys))
+    totals = {
+        column: np.bincount(keys, weights=game_scores[column].to_numpy(), minlength=n_keys)[played].astype(np.int64)
+        for column in ('is_win', 'is_loss', 'is_tie')
+    }
+    return pd.DataFrame({
+        'season': season_labels.to_numpy()[played // n_teams],
+        'team': team_labels.to_numpy()[played % n_teams],
+        **totals
+    })
 
 
 def calculate_standings_from_scores(game_scores: pd.DataFrame, db: Optional[Session] = None) -> pd.DataFrame:
@@ -142,7 +309,7 @@ def calculate_standings_from_scores(game_scores: pd.DataFrame, db: Optional[Sess
                                      'in_division_is_win', 'in_division_is_loss', 'in_division_is_tie', 'in_division_pct'])
     
     # Calculate overall standings
-    standings = game_scores.groupby(['season', 'team'])[['is_win', 'is_loss', 'is_tie']].sum().reset_index()
+    standings = _sum_results_by_season_team(game_scores)
     standings['pct'] = (standings['is_win'] + standings['is_tie'] / 2) / (
         standings['is_win'] + standings['is_loss'] + standings['is_tie']
     )
@@ -151,36 +318,17 @@ def calculate_standings_from_scores(game_scores: pd.DataFrame, db: Optional[Sess
     
     # Calculate in-division standings if we have database access
     if db is not None:
-        # Get realignment data
-        realignments = db.query(TeamRealignment).all()
-        realignment_df = pd.DataFrame([
-            {'team': r.team, 'division': r.division}
-            for r in realignments
-        ])
+        # Get realignment data (process-level team -> division lookup)
+        division_map = get_division_map(db)
         
-        if not realignment_df.empty:
-            # Merge division info for teams
-            game_scores_with_division = game_scores.merge(
-                realignment_df[['team', 'division']],
-                how='left',
-                on='team'
-            )
-            
-            # Merge division info for opponents
-            game_scores_with_division = game_scores_with_division.merge(
-                realignment_df[['team', 'division']].rename(columns={'team': 'opponent', 'division': 'opponent_division'}),
-                how='left',
-                on='opponent'
-            )
-            
+        if division_map:
             # Filter to in-division games (where team's division == opponent's division)
-            in_division_games = game_scores_with_division.loc[
-                game_scores_with_division['division'] == game_scores_with_division['opponent_division']
-            ]
+            same_division = game_scores['team'].map(division_map) == game_scores['opponent'].map(division_map)
+            in_division_games = game_scores.loc[same_division.to_numpy()]
             
             if not in_division_games.empty:
                 # Calculate in-division standings
-                standings_div = in_division_games.groupby(['season', 'team'])[['is_win', 'is_loss', 'is_tie']].sum().reset_index()
+                standings_div = _sum_results_by_season_team(in_division_games)
                 standings_div['in_division_pct'] = (standings_div['is_win'] + standings_div['is_tie'] / 2) / (
                     standings_div['is_win'] + standings_div['is_loss'] + standings_div['is_tie']
                 )
@@ -227,13 +375,126 @@ def calculate_standings_from_scores(game_scores: pd.DataFrame, db: Optional[Sess
     return standings
 
 
-def scrape_season(season: Optional[int], db: Session) -> int:
+# Columns written to team_game_scores, as produced by create_game_scores_dataframe
+_GAME_SCORE_ROW_KEYS = [
+    'season', 'gameday', 'gametime', 'score', 'team', 'opponent', 'opponent_score',
+    'is_win', 'is_loss', 'is_tie', 'is_division_game'
+]
+
+# Standings DataFrame column -> team_standings column
+_STANDING_DF_TO_DB = {
+    'season': 'season',
+    'team': 'team',
+    'is_win': 'wins',
+    'is_loss': 'losses',
+    'is_tie': 'ties',
+    'pct': 'win_pct',
+    'in_division_is_win': 'in_division_wins',
+    'in_division_is_loss': 'in_division_losses',
+    'in_division_is_tie': 'in_division_ties',
+    'in_division_pct': 'in_division_win_pct'
+}
+
+
+def _dialect_insert(db: Session):
+    """
+    Get the dialect-specific insert() construct (supports ON CONFLICT) for the session's database.
+    """
+    if db.get_bind().dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert
+
+
+def _upsert(db: Session, model, rows: List[dict], index_elements: List[str], chunk_size: int = 500):
+    """
+    Insert rows into a model's table, updating existing rows on conflict.
+    
+    Args:
+        db: Database session
+        model: SQLAlchemy model class to write to
+        rows: List of column dictionaries (all with the same keys)
+        index_elements: Columns of the unique index used to detect conflicts
+        chunk_size: Rows per INSERT statement (keeps SQLite under its bound-parameter limit)
+    """
+    dialect_insert = _dialect_insert(db)
+    
+    for start in range(0, len(rows), chunk_size):
+        stmt = dialect_insert(model).values(rows[start:start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                c.name: c
+                for c in stmt.excluded
+                if c.name != 'id' and c.name not in index_elements
+            }
+        )
+        db.execute(stmt)
+
+
+def _save_game_scores(game_scores_df: pd.DataFrame, db: Session) -> int:
+    """
+    Upsert game scores (one row per team per game) into the database.
+    
+    Returns:
+        Number of game score rows written
+    """
+    division_map = get_division_map(db)
+    game_scores_df = game_scores_df.assign(
+        is_division_game=game_scores_df['team'].map(division_map) == game_scores_df['opponent'].map(division_map)
+    )
+    
+    rows = game_scores_df[_GAME_SCORE_ROW_KEYS].astype({
+        'season': int,
+        'score': int,
+        'opponent_score': int,
+        'is_win': int,
+        'is_loss': int,
+        'is_tie': int,
+        'is_division_game': bool
+    })
+    # Missing game times are stored as NULL
+    rows['gametime'] = rows['gametime'].astype(object).where(rows['gametime'].notna(), None)
+    rows = rows.to_dict('records')
+    _upsert(db, TeamGameScore, rows, ['season', 'gameday', 'team'])
+    return len(rows)
+
+
+def _save_standings(standings_df: pd.DataFrame, db: Session) -> int:
+    """
+    Upsert team standings (one row per team per season) into the database.
+    
+    Returns:
+        Number of standing rows written
+    """
+    # Build the payload straight from the column arrays; tolist() yields native
+    # Python ints/floats, and missing counts/percentages are stored as 0
+    columns = []
+    for df_column, db_column in _STANDING_DF_TO_DB.items():
+        values = standings_df[df_column].to_numpy()
+        if db_column == 'team':
+            columns.append(values.tolist())
+        elif db_column.endswith('win_pct'):
+            columns.append(np.nan_to_num(values.astype(np.float64)).tolist())
+        else:
+            columns.append(np.nan_to_num(values.astype(np.float64)).astype(np.int64).tolist())
+    
+    db_columns = list(_STANDING_DF_TO_DB.values())
+    rows = [dict(zip(db_columns, values)) for values in zip(*columns)]
+    _upsert(db, TeamStanding, rows, ['season', 'team'])
+    return len(rows)
+
+
+def scrape_season(season: Optional[int], db: Session, commit: bool = True) -> int:
     """
     Scrape standings for a specific season and store in database.
     
     Args:
         season: Season year. If None, uses current season (seasons=None returns most recent)
         db: Database session
+        commit: If True (default), commits the writes. If False, leaves them in the
+                open transaction for the caller to commit (or roll back on error).
     
     Returns:
         Number of records updated
@@ -242,9 +503,9 @@ def scrape_season(season: Optional[int], db: Session) -> int:
         # Load schedule data
         # nflreadpy: seasons=None returns most recent season, seasons=True returns all seasons
         if season is None:
-            scores = nfl.load_schedules(seasons=None).to_pandas()  # Most recent season
+            scores = load_schedules(seasons=None)  # Most recent season
         else:
-            scores = nfl.load_schedules(seasons=season).to_pandas()  # Specific season
+            scores = load_schedules(seasons=season)  # Specific season
         
         # Create game scores dataframe
         game_scores_df = create_game_scores_dataframe(scores)
@@ -253,81 +514,15 @@ def scrape_season(season: Optional[int], db: Session) -> int:
             return 0
         
         # Save game scores to database
-        game_scores_updated = 0
-        for _, row in game_scores_df.iterrows():
-            # Check if this game score already exists
-            existing = db.query(TeamGameScore).filter(
-                TeamGameScore.season == int(row['season']),
-                TeamGameScore.gameday == row['gameday'],
-                TeamGameScore.team == row['team']
-            ).first()
-            
-            if existing:
-                # Update existing record
-                existing.gametime = row['gametime'] if pd.notna(row['gametime']) else None
-                existing.score = int(row['score'])
-                existing.opponent = row['opponent']
-                existing.opponent_score = int(row['opponent_score'])
-                existing.is_win = int(row['is_win'])
-                existing.is_loss = int(row['is_loss'])
-                existing.is_tie = int(row['is_tie'])
-            else:
-                # Create new record
-                new_game_score = TeamGameScore(
-                    season=int(row['season']),
-                    gameday=row['gameday'],
-                    gametime=row['gametime'] if pd.notna(row['gametime']) else None,
-                    score=int(row['score']),
-                    team=row['team'],
-                    opponent=row['opponent'],
-                    opponent_score=int(row['opponent_score']),
-                    is_win=int(row['is_win']),
-                    is_loss=int(row['is_loss']),
-                    is_tie=int(row['is_tie'])
-                )
-                db.add(new_game_score)
-            
-            game_scores_updated += 1
+        _save_game_scores(game_scores_df, db)
         
         # Calculate standings from game scores (pass db for in-division calculations)
         standings_df = calculate_standings_from_scores(game_scores_df, db)
+        records_updated = _save_standings(standings_df, db)
         
-        records_updated = 0
-        for _, row in standings_df.iterrows():
-            # Update or create team standing
-            existing = db.query(TeamStanding).filter(
-                TeamStanding.season == row['season'],
-                TeamStanding.team == row['team']
-            ).first()
-            
-            if existing:
-                existing.wins = int(row['is_win']) if pd.notna(row['is_win']) else 0
-                existing.losses = int(row['is_loss']) if pd.notna(row['is_loss']) else 0
-                existing.ties = int(row['is_tie']) if pd.notna(row['is_tie']) else 0
-                existing.win_pct = float(row['pct']) if pd.notna(row['pct']) else 0.0
-                existing.in_division_wins = int(row['in_division_is_win']) if pd.notna(row['in_division_is_win']) else 0
-                existing.in_division_losses = int(row['in_division_is_loss']) if pd.notna(row['in_division_is_loss']) else 0
-                existing.in_division_ties = int(row['in_division_is_tie']) if pd.notna(row['in_division_is_tie']) else 0
-                existing.in_division_win_pct = float(row['in_division_pct']) if pd.notna(row['in_division_pct']) else 0.0
-                existing.last_updated = datetime.utcnow()
-            else:
-                new_standing = TeamStanding(
-                    season=int(row['season']),
-                    team=row['team'],
-                    wins=int(row['is_win']) if pd.notna(row['is_win']) else 0,
-                    losses=int(row['is_loss']) if pd.notna(row['is_loss']) else 0,
-                    ties=int(row['is_tie']) if pd.notna(row['is_tie']) else 0,
-                    win_pct=float(row['pct']) if pd.notna(row['pct']) else 0.0,
-                    in_division_wins=int(row['in_division_is_win']) if pd.notna(row['in_division_is_win']) else 0,
-                    in_division_losses=int(row['in_division_is_loss']) if pd.notna(row['in_division_is_loss']) else 0,
-                    in_division_ties=int(row['in_division_is_tie']) if pd.notna(row['in_division_is_tie']) else 0,
-                    in_division_win_pct=float(row['in_division_pct']) if pd.notna(row['in_division_pct']) else 0.0
-                )
-                db.add(new_standing)
-            
-            records_updated += 1
-        
-        db.commit()
+        if commit:
+            db.commit()
+            invalidate_standings_cache()
         return records_updated
         
     except Exception as e:
@@ -348,7 +543,9 @@ def scrape_all_seasons(db: Session) -> dict:
     """
     try:
         # Load all seasons
-        scores = nfl.load_schedules(seasons=True).to_pandas()
+        # nflreadpy serves every season from a single schedule file, so this is
+        # one download; fanning out per-season requests would only repeat it
+        scores = load_schedules(seasons=True)
         
         # Create game scores dataframe
         game_scores_df = create_game_scores_dataframe(scores)
@@ -356,96 +553,26 @@ def scrape_all_seasons(db: Session) -> dict:
         if game_scores_df.empty:
             return {'success': False, 'error': 'No game scores data found', 'records_updated': 0}
         
-        # Get unique seasons from game scores
-        seasons = sorted(game_scores_df['season'].unique())
-        seasons_str = ','.join(map(str, seasons))
+        # Get unique seasons from game scores (np.unique returns them sorted)
+        seasons = np.unique(game_scores_df['season'].to_numpy())
+        seasons_str = ','.join(seasons.astype(str))
         
         # Save game scores to database
-        game_scores_updated = 0
-        for _, row in game_scores_df.iterrows():
-            # Check if this game score already exists
-            existing = db.query(TeamGameScore).filter(
-                TeamGameScore.season == int(row['season']),
-                TeamGameScore.gameday == row['gameday'],
-                TeamGameScore.team == row['team']
-            ).first()
-            
-            if existing:
-                # Update existing record
-                existing.gametime = row['gametime'] if pd.notna(row['gametime']) else None
-                existing.score = int(row['score'])
-                existing.opponent = row['opponent']
-                existing.opponent_score = int(row['opponent_score'])
-                existing.is_win = int(row['is_win'])
-                existing.is_loss = int(row['is_loss'])
-                existing.is_tie = int(row['is_tie'])
-            else:
-                # Create new record
-                new_game_score = TeamGameScore(
-                    season=int(row['season']),
-                    gameday=row['gameday'],
-                    gametime=row['gametime'] if pd.notna(row['gametime']) else None,
-                    score=int(row['score']),
-                    team=row['team'],
-                    opponent=row['opponent'],
-                    opponent_score=int(row['opponent_score']),
-                    is_win=int(row['is_win']),
-                    is_loss=int(row['is_loss']),
-                    is_tie=int(row['is_tie'])
-                )
-                db.add(new_game_score)
-            
-            game_scores_updated += 1
+        _save_game_scores(game_scores_df, db)
         
         # Calculate standings from game scores (pass db for in-division calculations)
         standings_df = calculate_standings_from_scores(game_scores_df, db)
+        records_updated = _save_standings(standings_df, db)
         
-        records_updated = 0
-        for _, row in standings_df.iterrows():
-            # Update or create team standing
-            existing = db.query(TeamStanding).filter(
-                TeamStanding.season == row['season'],
-                TeamStanding.team == row['team']
-            ).first()
-            
-            if existing:
-                existing.wins = int(row['is_win']) if pd.notna(row['is_win']) else 0
-                existing.losses = int(row['is_loss']) if pd.notna(row['is_loss']) else 0
-                existing.ties = int(row['is_tie']) if pd.notna(row['is_tie']) else 0
-                existing.win_pct = float(row['pct']) if pd.notna(row['pct']) else 0.0
-                existing.in_division_wins = int(row['in_division_is_win']) if pd.notna(row['in_division_is_win']) else 0
-                existing.in_division_losses = int(row['in_division_is_loss']) if pd.notna(row['in_division_is_loss']) else 0
-                existing.in_division_ties = int(row['in_division_is_tie']) if pd.notna(row['in_division_is_tie']) else 0
-                existing.in_division_win_pct = float(row['in_division_pct']) if pd.notna(row['in_division_pct']) else 0.0
-                existing.last_updated = datetime.utcnow()
-            else:
-                new_standing = TeamStanding(
-                    season=int(row['season']),
-                    team=row['team'],
-                    wins=int(row['is_win']) if pd.notna(row['is_win']) else 0,
-                    losses=int(row['is_loss']) if pd.notna(row['is_loss']) else 0,
-                    ties=int(row['is_tie']) if pd.notna(row['is_tie']) else 0,
-                    win_pct=float(row['pct']) if pd.notna(row['pct']) else 0.0,
-                    in_division_wins=int(row['in_division_is_win']) if pd.notna(row['in_division_is_win']) else 0,
-                    in_division_losses=int(row['in_division_is_loss']) if pd.notna(row['in_division_is_loss']) else 0,
-                    in_division_ties=int(row['in_division_is_tie']) if pd.notna(row['in_division_is_tie']) else 0,
-                    in_division_win_pct=float(row['in_division_pct']) if pd.notna(row['in_division_pct']) else 0.0
-                )
-                db.add(new_standing)
-            
-            records_updated += 1
-        
-        db.commit()
-        
-        # Log the scrape
+        # Log the scrape in the same transaction as the data, so one commit covers both
         log = ScrapeLog(
-            scrape_date=datetime.utcnow(),
             seasons_scraped=seasons_str,
             success=True,
             records_updated=records_updated
         )
         db.add(log)
         db.commit()
+        invalidate_standings_cache()
         
         return {
             'success': True,
@@ -459,7 +586,6 @@ def scrape_all_seasons(db: Session) -> dict:
         
         # Log the error
         log = ScrapeLog(
-            scrape_date=datetime.utcnow(),
             seasons_scraped='',
             success=False,
             error_message=error_msg[:1000],
@@ -487,21 +613,21 @@ def scrape_current_season(db: Session) -> dict:
         Dictionary with scrape results
     """
     try:
-        records_updated = scrape_season(None, db)  # None = current season
+        records_updated = scrape_season(None, db, commit=False)  # None = current season
         
         # Get current year for logging
         current_year = datetime.now().year
         seasons_str = str(current_year)
         
-        # Log the scrape
+        # Log the scrape and commit it together with the season's data
         log = ScrapeLog(
-            scrape_date=datetime.utcnow(),
             seasons_scraped=seasons_str,
             success=True,
             records_updated=records_updated
         )
         db.add(log)
         db.commit()
+        invalidate_standings_cache()
         
         return {
             'success': True,
@@ -515,7 +641,6 @@ def scrape_current_season(db: Session) -> dict:
         
         # Log the error
         log = ScrapeLog(
-            scrape_date=datetime.utcnow(),
             seasons_scraped='',
             success=False,
             error_message=error_msg[:1000],
@@ -1,9 +1,141 @@
-from typing import Optional, Dict, List
+import sys
+import threading
+from collections import defaultdict
+from typing import Optional, Dict, List, NamedTuple
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from sqlalchemy import distinct
-from database import get_db_session
+from sqlalchemy import bindparam, func, select
+from database import session_scope
 from models import TeamStanding, TeamRealignment
 
+# Columns returned by get_standings_from_db, selected directly (no ORM instances)
+STANDING_COLUMNS = (
+    TeamStanding.season,
+    TeamStanding.team,
+    TeamStanding.wins,
+    TeamStanding.losses,
+    TeamStanding.ties,
+    TeamStanding.win_pct,
+    TeamStanding.in_division_wins,
+    TeamStanding.in_division_losses,
+    TeamStanding.in_division_ties,
+    TeamStanding.in_division_win_pct
+)
+
+# Statements are built once at import; per call only the bound 'season' value
+# changes. With no season, the most recent one is resolved inside the same query
+_LATEST_SEASON = select(func.max(TeamStanding.season)).scalar_subquery()
+
+_LATEST_STANDINGS_STMT = select(*STANDING_COLUMNS).where(TeamStanding.season == _LATEST_SEASON)
+_STANDINGS_FOR_SEASONS_STMT = select(*STANDING_COLUMNS).where(
+    TeamStanding.season.in_(bindparam('seasons', expanding=True))
+)
+
+# Standings joined with their realignment data; teams without a realignment
+# entry are dropped by the inner join. Rows arrive already ranked, so each
+# division list is built in order: win percentage, then in-division win
+# percentage as tiebreaker
+_GROUPED_STANDINGS_STMT = select(
+    TeamStanding.team,
+    TeamRealignment.name,
+    TeamStanding.wins,
+    TeamStanding.losses,
+    TeamStanding.ties,
+    TeamStanding.win_pct,
+    TeamStanding.in_division_wins,
+    TeamStanding.in_division_losses,
+    TeamStanding.in_division_ties,
+    TeamStanding.in_division_win_pct,
+    TeamStanding.season,
+    TeamRealignment.conference,
+    TeamRealignment.division
+).join(
+    TeamRealignment, TeamRealignment.team == TeamStanding.team
+).order_by(
+    TeamStanding.win_pct.desc(),
+    TeamStanding.in_division_win_pct.desc()
+)
+_GROUPED_STANDINGS_FOR_SEASON_STMT = _GROUPED_STANDINGS_STMT.where(TeamStanding.season == bindparam('season'))
+_GROUPED_LATEST_STANDINGS_STMT = _GROUPED_STANDINGS_STMT.where(TeamStanding.season == _LATEST_SEASON)
+
+_REALIGNMENT_STMT = select(
+    TeamRealignment.team, TeamRealignment.conference, TeamRealignment.division, TeamRealignment.name
+)
+
+# Fixed single-column query, run on the driver directly (see get_available_seasons)
+_AVAILABLE_SEASONS_SQL = f"SELECT DISTINCT season FROM {TeamStanding.__tablename__} ORDER BY season DESC"
+
+
+class Realignment(NamedTuple):
+    """A team's custom conference, division, and display name."""
+    conference: str
+    division: str
+    name: str
+
+
+# Process-level cache of team -> realignment info; team_realignment only changes
+# when realignment is (re)initialized, which reloads it via load_realignment_map().
+# The version is bumped on every reload so results derived from an older map
+# (e.g. cached standings) are never served again
+_realignment_map: Optional[Dict[str, Realignment]] = None
+_realignment_version = 0
+
+
+# get_standings results by season. Writes from this process invalidate it via
+# invalidate_standings_cache(); the TTL bounds staleness after writes made by
+# another process (e.g. the cron job). main.py's response cache uses the same
+# TTL, so this setting governs API staleness too
+STANDINGS_CACHE_TTL = 300
+_standings_cache = TTLCache(maxsize=64, ttl=STANDINGS_CACHE_TTL)
+_standings_cache_lock = threading.Lock()
+# Bumped on every invalidation, so a load that raced one doesn't store stale data
+_standings_cache_generation = 0
+
+
+def invalidate_standings_cache():
+    """Drop all cached get_standings results (call after writing standings or realignment)."""
+    global _standings_cache_generation
+    with _standings_cache_lock:
+        _standings_cache.clear()
+        _standings_cache_generation += 1
+
+
+def load_realignment_map(db: Session) -> Dict[str, Realignment]:
+    """
+    (Re)load the team realignment map from the database into the process cache.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Dictionary mapping team abbreviation to its Realignment (conference, division, name).
+    """
+    global _realignment_map, _realignment_version
+    realignments = db.execute(_REALIGNMENT_STMT).all()
+    # Intern the handful of distinct conference/division names: teams sharing a
+    # division then share one string object, so equality checks hit the identity fast path
+    _realignment_map = {
+        r.team: Realignment(sys.intern(r.conference), sys.intern(r.division), r.name)
+        for r in realignments
+    }
+    _realignment_version += 1
+    return _realignment_map
+
+
+def get_realignment_map(db: Session) -> Dict[str, Realignment]:
+    """
+    Get the cached team realignment map, loading it on first use.
+    
+    Args:
+        db: Database session (only used if the cache is empty)
+    
+    Returns:
+        Dictionary mapping team abbreviation to its Realignment (conference, division, name).
+    """
+    if not _realignment_map:
+        return load_realignment_map(db)
+    return _realignment_map
+
 
 def get_standings_from_db(season: Optional[int] = None, db: Optional[Session] = None) -> list:
     """
@@ -16,51 +148,47 @@ def get_standings_from_db(season: Optional[int] = None, db: Optional[Session] =
     Returns:
         List of team standing dictionaries.
     """
-    if db is None:
-        db = get_db_session()
-        close_db = True
-    else:
-        close_db = False
-    
-    try:
-        query = db.query(TeamStanding)
+    if season is not None:
+        return get_standings_from_db_multi([season], db)[season]
+    
+    with session_scope(db) as db:
+        rows = db.execute(_LATEST_STANDINGS_STMT).mappings().all()
         
-        if season is not None:
-            query = query.filter(TeamStanding.season == season)
-        else:
-            # Get the most recent season
-            max_season = db.query(TeamStanding.season).order_by(TeamStanding.season.desc()).first()
-            if max_season:
-                query = query.filter(TeamStanding.season == max_season[0])
-            else:
-                return []
+        return [dict(row) for row in rows]
+
+
+def get_standings_from_db_multi(seasons: List[int], db: Optional[Session] = None) -> Dict[int, list]:
+    """
+    Get standings for several seasons from database in a single query.
+    
+    Args:
+        seasons: Season years to fetch.
+        db: Optional database session. If None, creates a new session.
+    
+    Returns:
+        Dictionary mapping each requested season to its list of team standing
+        dictionaries (empty if the season has no standings).
+    """
+    result = {season: [] for season in seasons}
+    if not result:
+        return result
+    
+    with session_scope(db) as db:
+        rows = db.execute(_STANDINGS_FOR_SEASONS_STMT, {'seasons': list(result)}).mappings()
         
-        standings = query.all()
+        for row in rows:
+            result[row['season']].append(dict(row))
         
-        return [
-            {
-                'season': s.season,
-                'team': s.team,
-                'wins': s.wins,
-                'losses': s.losses,
-                'ties': s.ties,
-                'win_pct': s.win_pct,
-                'in_division_wins': s.in_division_wins,
-                'in_division_losses': s.in_division_losses,
-                'in_division_ties': s.in_division_ties,
-                'in_division_win_pct': s.in_division_win_pct
-            }
-            for s in standings
-        ]
-    finally:
-        if close_db:
-            db.close()
+        return result
 
 
 def get_standings(season: Optional[int] = None, db: Optional[Session] = None) -> Dict:
     """
     Get standings organized by custom conferences and divisions from database.
     
+    Results are cached per (season, realignment version) until
+    invalidate_standings_cache() is called (or STANDINGS_CACHE_TTL expires).
+    
     Args:
         season: Optional season year. If None, uses most recent season in database.
         db: Optional database session. If None, creates a new session.
@@ -68,75 +196,46 @@ def get_standings(season: Optional[int] = None, db: Optional[Session] = None) ->
     Returns:
         Dictionary with standings organized by conference and division.
     """
-    if db is None:
-        db = get_db_session()
-        close_db = True
-    else:
-        close_db = False
-    
-    try:
-        # Get standings from database
-        standings_list = get_standings_from_db(season, db)
-        
-        if not standings_list:
-            return {}
-        
-        # Get realignment data
-        realignments = db.query(TeamRealignment).all()
-        realignment_map = {
-            r.team: {
-                'conference': r.conference,
-                'division': r.division,
-                'name': r.name
-            }
-            for r in realignments
-        }
+    key = (season, _realignment_version)
+    with _standings_cache_lock:
+        cached = _standings_cache.get(key)
+        generation = _standings_cache_generation
+    if cached is not None:
+        return cached
+    
+    with session_scope(db) as db:
+        # Get standings joined with their realignment data in one query, ranked
+        if season is None:
+            rows = db.execute(_GROUPED_LATEST_STANDINGS_STMT)
+        else:
+            rows = db.execute(_GROUPED_STANDINGS_FOR_SEASON_STMT, {'season': season})
         
         # Organize by conference and division
-        result = {}
+        grouped = defaultdict(lambda: defaultdict(list))
         
         # Group standings by conference and division
-        for standing in standings_list:
-            team = standing['team']
-            if team not in realignment_map:
-                continue
-            
-            realignment = realignment_map[team]
-            conference = realignment['conference']
-            division = realignment['division']
-            
-            if conference not in result:
-                result[conference] = {}
-            
-            if division not in result[conference]:
-                result[conference][division] = []
-            
-            result[conference][division].append({
-                'team': team,
-                'name': realignment['name'],
-                'wins': standing['wins'],
-                'losses': standing['losses'],
-                'ties': standing['ties'],
-                'win_pct': standing['win_pct'],
-                'in_division_wins': standing['in_division_wins'],
-                'in_division_losses': standing['in_division_losses'],
-                'in_division_ties': standing['in_division_ties'],
-                'in_division_win_pct': standing['in_division_win_pct'],
-                'season': standing['season']
+        for row in rows:
+            grouped[row.conference][row.division].append({
+                'team': row.team,
+                'name': row.name,
+                'wins': row.wins,
+                'losses': row.losses,
+                'ties': row.ties,
+                'win_pct': row.win_pct,
+                'in_division_wins': row.in_division_wins,
+                'in_division_losses': row.in_division_losses,
+                'in_division_ties': row.in_division_ties,
+                'in_division_win_pct': row.in_division_win_pct,
+                'season': row.season
             })
         
-        # Sort teams within each division by win percentage, then by in-division win percentage as tiebreaker
-        for conference in result:
-            for division in result[conference]:
-                result[conference][division].sort(
-                    key=lambda x: (x['win_pct'], x['in_division_win_pct']), 
-                    reverse=True
-                )
+        # Plain dicts, so the cached result can't grow keys on lookup
+        result = {conference: dict(divisions) for conference, divisions in grouped.items()}
         
+        with _standings_cache_lock:
+            if generation == _standings_cache_generation:
+                _standings_cache[key] = result
         return result
-    finally:
-        if close_db:
-            db.close()
 
 
 def get_available_seasons(db: Optional[Session] = None) -> List[int]:
@@ -149,16 +248,9 @@ def get_available_seasons(db: Optional[Session] = None) -> List[int]:
     Returns:
         List of season years, sorted in descending order.
     """
-    if db is None:
-        db = get_db_session()
-        close_db = True
-    else:
-        close_db = False
-    
-    try:
-        seasons = db.query(distinct(TeamStanding.season)).order_by(TeamStanding.season.desc()).all()
+    with session_scope(db) as db:
+        # Fixed single-column query: run it on the driver directly and skip
+        # SQLAlchemy's statement construction and Row objects
+        seasons = db.connection().exec_driver_sql(_AVAILABLE_SEASONS_SQL).fetchall()
         return [season[0] for season in seasons]
-    finally:
-        if close_db:
-            db.close()
 